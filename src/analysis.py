@@ -2,11 +2,14 @@
 Analysis module for extracting themes and folklore from slave narratives.
 """
 
+import hashlib
 import re
 from collections import Counter, defaultdict
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 import string
 
+import numpy as np
+
 
 class NarrativeAnalyzer:
     """Analyzer for extracting themes and patterns from narratives."""
@@ -60,19 +63,93 @@ class NarrativeAnalyzer:
         ]
     }
 
-    # Folklore-specific patterns
-    FOLKLORE_PATTERNS = {
-        'Ghost Stories': ['ghost', 'haint', 'haunt', 'spirit', 'dead', 'cemetery', 'graveyard'],
-        'Conjure & Magic': ['conjure', 'conjurer', 'conjur', 'witch', 'charm', 'spell', 'hex', 'root doctor', 'voodoo'],
-        'Supernatural Beliefs': ['sign', 'omen', 'luck', 'unlucky', 'fortune', 'predict', 'dream'],
-        'Folk Medicine': ['remedy', 'cure', 'herb', 'tea', 'poultice', 'doctor', 'sick', 'medicine'],
-        'Songs & Music': ['sing', 'song', 'spiritual', 'hymn', 'music', 'fiddle', 'banjo', 'dance'],
-        'Stories & Tales': ['story', 'tale', 'tell', 'told', 'heard', 'say', 'remember']
+    # Folklore sentence classifier features. Each category has three tiers:
+    # 'strong' terms are specific enough to tag a sentence on their own,
+    # 'weak' terms (e.g. "tea", "told") only count when the same sentence also
+    # contains one of the category's 'cues', which supply the missing context.
+    # A cue must not contain one of its category's weak terms, or it would
+    # corroborate itself.
+    # Most narratives are transcribed in dialect, so the lists include the
+    # spellings used in the texts. Leading and trailing apostrophes are left
+    # off ("member" matches "'member", "ghos" matches "ghos'").
+    FOLKLORE_FEATURES = {
+        'Ghost Stories': {
+            'strong': ['ghost', 'ghosts', 'ghos', 'haint', 'haints', 'hant', 'hants',
+                       'haunt', 'haunted', 'haunts', 'spook', 'spooks', 'apparition'],
+            'weak': ['spirit', 'spirits', 'sperrit', 'sperrits', 'dead', 'daid',
+                     'cemetery', 'graveyard', 'grave', 'buryin', 'corpse', 'something'],
+            'cues': ['night', 'believe', "b'lieve", "b'leeb", 'scared', 'skeered',
+                     'skeer', 'afraid', 'fraid', 'come back', 'came back', 'appeared',
+                     'headless']
+        },
+        'Conjure & Magic': {
+            'strong': ['conjure', 'conjured', 'conjurer', 'conjurers', 'conjur',
+                       'conjuh', 'witch', 'witches', 'witchcraft', 'hoodoo', 'voodoo',
+                       'hex', 'root doctor', 'root worker', 'two-headed doctor',
+                       'charm', 'charms'],
+            'weak': ['spell', 'trick', 'tricked', 'bag', 'root', 'roots', 'powder'],
+            'cues': ['on him', 'on her', 'on me', 'believe', "b'lieve", "b'leeb",
+                     'evil', 'power', 'hair']
+        },
+        'Supernatural Beliefs': {
+            'strong': ['omen', 'omens', 'bad luck', 'good luck', 'unlucky',
+                       'superstition', 'superstitions', 'superstitious',
+                       'screech owl', 'sign of death', 'rabbit foot', "rabbit's foot"],
+            'weak': ['sign', 'signs', 'luck', 'fortune', 'dream', 'dreamed',
+                     'dreamt', 'predict', 'predicted', 'owl'],
+            'cues': ['believe', 'believed', "b'lieve", "b'leeb", 'death',
+                     'old folks', 'ole folks', "ol' folks", 'if you']
+        },
+        'Folk Medicine': {
+            'strong': ['remedy', 'remedies', 'poultice', 'poultices', 'herb',
+                       'herbs', 'yarb', 'yarbs', 'tonic', 'salve', 'home remedies',
+                       'root tea', 'herb tea', 'bark tea', 'asafetida', 'horehound'],
+            'weak': ['tea', 'cure', 'cured', 'cures', 'doctor', 'doctah', 'docter',
+                     'sick', 'misery', 'medicine', 'fever', 'chills', 'leaves', 'bark',
+                     'turpentine'],
+            'cues': ['boil', 'boiled', 'bile', 'biled', 'drink', 'rub', 'grease',
+                     'weed', 'weeds', 'woods', 'dose']
+        },
+        'Songs & Music': {
+            'strong': ['song', 'songs', 'spiritual', 'spirituals', 'hymn', 'hymns',
+                       'fiddle', 'banjo', 'sing', 'sang', 'sung', 'singing', 'singin'],
+            'weak': ['music', 'dance', 'dances', 'dancing', 'dancin', 'play', 'played',
+                     'tune'],
+            'cues': ['party', 'parties', 'frolic', 'frolics', 'church', 'night',
+                     'saturday', 'corn shucking', 'shout', 'pat', 'patting']
+        },
+        'Stories & Tales': {
+            'strong': ['folk tale', 'folk tales', 'tale', 'tales', 'brer', "br'er",
+                       'buh', 'buh rabbit', 'legend', 'legends', 'fable',
+                       'ghost story', 'ghost stories', "ghos' stories", 'hant story',
+                       'hant stories', 'story about', 'stories about', "story 'bout",
+                       "stories 'bout", 'raw head', 'bloody bones'],
+            'weak': ['story', 'stories', 'tell', 'told', 'tole', 'tol', 'telling',
+                     'tellin', 'heard', 'heared', 'heerd', 'say', 'says', 'remember',
+                     'member'],
+            'cues': ['old folks', 'ole folks', "ol' folks", 'old people', 'rabbit',
+                     'fox', 'bear', 'once', 'wintertime', 'devil', 'debbil']
+        }
     }
 
+    # Classifier weights and tagging threshold. A single strong term reaches the
+    # threshold; weak terms need corroborating cues (one weak term plus two cues,
+    # or two weak terms plus one cue). Weak terms and cues count once per
+    # sentence however often they repeat, and cues are capped per category.
+    FOLKLORE_WEIGHTS = {'strong': 2.0, 'weak': 1.0, 'cues': 0.5}
+    FOLKLORE_CUE_CAP = 2
+    FOLKLORE_THRESHOLD = 2.0
+
+    # Sentences run up to terminal punctuation (plus closing quotes/brackets) or
+    # a blank line, whichever comes first.
+    SENTENCE_PATTERN = re.compile(r'\S(?:[^.!?\n]|\n(?![ \t]*\n))*(?:[.!?]+["\')\]]*)?')
+    ABBREVIATION_PATTERN = re.compile(r'\b(?:Mr|Mrs|Dr|St|Jr|Sr|Mt|Rev|Gen|Capt|Col)\.$')
+
     def __init__(self, narratives_by_state: Dict):
         """Initialize analyzer with parsed narratives."""
         self.narratives_by_state = narratives_by_state
+        self._sentence_index = None
+        self._folklore_sentences = None
 
     def analyze_themes(self) -> Dict:
         """
@@ -108,46 +185,259 @@ class NarrativeAnalyzer:
 
         return theme_analysis
 
-    def extract_folklore(self) -> Dict:
+    @classmethod
+    def split_sentences(cls, text: str) -> List[Tuple[int, int]]:
         """
-        Extract folklore and folk tale references from narratives.
+        Split text into sentences.
+
+        Args:
+            text: Narrative text
 
         Returns:
-            Dictionary with folklore analysis for each state
+            List of (start, end) character offsets, one per sentence
         """
-        folklore_analysis = {}
+        spans = []
+
+        for match in cls.SENTENCE_PATTERN.finditer(text):
+            start = match.start()
+            end = start + len(match.group().rstrip())
+
+            # Rejoin sentences that were split after an abbreviation like "Mrs."
+            if spans and cls.ABBREVIATION_PATTERN.search(text[spans[-1][0]:spans[-1][1]]) \
+                    and '\n\n' not in text[spans[-1][1]:start]:
+                spans[-1] = (spans[-1][0], end)
+            else:
+                spans.append((start, end))
+
+        return spans
+
+    def build_sentence_index(self) -> Dict:
+        """
+        Segment every narrative into sentences. The index is built once and
+        reused by the sentence-level analyses.
+
+        Returns:
+            Dictionary mapping states to a list of narratives, each with its
+            name, text length and hash, and the (start, end) offsets of its
+            sentences
+        """
+        if self._sentence_index is None:
+            self._sentence_index = {
+                state: [
+                    {
+                        'name': narrative['name'],
+                        'length': len(narrative['text']),
+                        'sha1': hashlib.sha1(narrative['text'].encode('utf-8')).hexdigest(),
+                        'sentences': self.split_sentences(narrative['text'])
+                    }
+                    for narrative in data['narratives']
+                ]
+                for state, data in self.narratives_by_state.items()
+            }
+
+        return self._sentence_index
+
+    def load_sentence_index(self, sentence_index: Dict) -> bool:
+        """
+        Reuse a previously built sentence index instead of segmenting the
+        narratives again.
+
+        Args:
+            sentence_index: Index as returned by build_sentence_index
+
+        Returns:
+            True if the index matches the current narratives and was loaded,
+            False if it is stale and will be rebuilt
+        """
+        if set(sentence_index) != set(self.narratives_by_state):
+            return False
 
         for state, data in self.narratives_by_state.items():
-            folklore_counts = defaultdict(int)
-            folklore_examples = defaultdict(list)
+            indexed = sentence_index[state]
+            if len(indexed) != len(data['narratives']):
+                return False
 
-            for narrative in data['narratives']:
-                text_lower = narrative['text'].lower()
+            for entry, narrative in zip(indexed, data['narratives']):
+                if entry.get('name') != narrative['name'] or \
+                        entry.get('length') != len(narrative['text']) or \
+                        entry.get('sha1') != hashlib.sha1(narrative['text'].encode('utf-8')).hexdigest():
+                    return False
 
-                # Count folklore pattern occurrences
-                for category, keywords in self.FOLKLORE_PATTERNS.items():
-                    for keyword in keywords:
-                        pattern = r'\b' + re.escape(keyword) + r'\b'
-                        matches = re.finditer(pattern, text_lower)
+        self._sentence_index = sentence_index
+        return True
 
-                        for match in matches:
-                            folklore_counts[category] += 1
+    def _build_folklore_model(self) -> Tuple[re.Pattern, Dict[str, int], Dict[str, np.ndarray]]:
+        """
+        Compile the folklore features into a single term matcher and one
+        term-by-category weight matrix per feature tier.
+        """
+        categories = list(self.FOLKLORE_FEATURES)
+        vocabulary = sorted({
+            term
+            for features in self.FOLKLORE_FEATURES.values()
+            for terms in features.values()
+            for term in terms
+        })
+        term_ids = {term: i for i, term in enumerate(vocabulary)}
+
+        # The matcher only reports the longest term starting at each position,
+        # so a phrase also counts the shorter terms it begins with ("tell" in
+        # "tell us", "ghos" in "ghos' stories"). Terms starting later inside a
+        # phrase are matched on their own because matches may overlap.
+        expansion = np.eye(len(vocabulary))
+        for term in vocabulary:
+            for prefix in vocabulary:
+                if term != prefix and re.match(re.escape(prefix) + r'\b', term):
+                    expansion[term_ids[term], term_ids[prefix]] = 1.0
+
+        tier_matrices = {}
+        for tier in self.FOLKLORE_WEIGHTS:
+            matrix = np.zeros((len(vocabulary), len(categories)))
+            for c, category in enumerate(categories):
+                for term in self.FOLKLORE_FEATURES[category][tier]:
+                    matrix[term_ids[term], c] = 1.0
+            tier_matrices[tier] = expansion @ matrix
+
+        # Longest terms first; the lookahead lets matches overlap
+        alternation = '|'.join(re.escape(term) for term in sorted(vocabulary, key=len, reverse=True))
+        matcher = re.compile(r'\b(?=(' + alternation + r')\b)')
+
+        return matcher, term_ids, tier_matrices
+
+    def _proper_nouns(self, text: str, positions: np.ndarray, sentence_starts: np.ndarray) -> np.ndarray:
+        """
+        Flag matches that are capitalized in the middle of a sentence, such
+        as the surname in "Mr. Heard's cruelty".
+
+        Args:
+            text: Original narrative text
+            positions: Match offsets
+            sentence_starts: Start offset of the sentence holding each match
+
+        Returns:
+            Boolean array, True where the match looks like a proper noun
+        """
+        return np.array([
+            text[pos].isupper() and text[start:pos].strip('"\'( ') != ''
+            for pos, start in zip(positions, sentence_starts)
+        ], dtype=bool)
+
+    def _score_sentences(self, term_counts: np.ndarray, tier_matrices: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Score a batch of sentences against every folklore category.
+
+        Args:
+            term_counts: Sentence-by-term matrix of feature counts
+            tier_matrices: Term-by-category matrix for each feature tier
+
+        Returns:
+            Sentence-by-category score matrix
+        """
+        present = (term_counts > 0).astype(float)
+        strong = term_counts @ tier_matrices['strong']
+        weak = present @ tier_matrices['weak']
+        cues = np.minimum(present @ tier_matrices['cues'], self.FOLKLORE_CUE_CAP)
+
+        # Weak terms and cues only count when they corroborate each other
+        corroborated = (weak > 0) & (cues > 0)
+
+        return (self.FOLKLORE_WEIGHTS['strong'] * strong +
+                corroborated * (self.FOLKLORE_WEIGHTS['weak'] * weak +
+                                self.FOLKLORE_WEIGHTS['cues'] * cues))
+
+    def classify_folklore_sentences(self) -> Dict:
+        """
+        Tag folklore sentences in every narrative. Each state's sentences are
+        scored together as one batch.
+
+        Returns:
+            Dictionary mapping states to their tagged sentences, each with the
+            narrative position and name, sentence offsets, text and categories
+        """
+        if self._folklore_sentences is not None:
+            return self._folklore_sentences
+
+        sentence_index = self.build_sentence_index()
+        categories = list(self.FOLKLORE_FEATURES)
+        matcher, term_ids, tier_matrices = self._build_folklore_model()
+        context_only = ~tier_matrices['strong'].any(axis=1)
+        folklore_sentences = {}
+
+        for state, data in self.narratives_by_state.items():
+            indexed = sentence_index[state]
+            rows = np.cumsum([0] + [len(entry['sentences']) for entry in indexed])
+            term_counts = np.zeros((rows[-1], len(term_ids)))
+
+            # Scan each narrative once, assigning every match to its sentence
+            for i, narrative in enumerate(data['narratives']):
+                spans = indexed[i]['sentences']
+                matches = list(matcher.finditer(narrative['text'].lower()))
+                if not spans or not matches:
+                    continue
+
+                starts = np.array([start for start, _ in spans])
+                ends = np.array([end for _, end in spans])
+                positions = np.array([m.start() for m in matches])
+                sentence_ids = np.searchsorted(starts, positions, side='right') - 1
+
+                # Drop matches that fall between sentences, and weak terms or
+                # cues that are really names
+                inside = (sentence_ids >= 0) & (positions < ends[sentence_ids.clip(0)])
+                terms = np.array([term_ids[m.group(1)] for m in matches])
+                inside &= ~(context_only[terms] &
+                            self._proper_nouns(narrative['text'], positions,
+                                               starts[sentence_ids.clip(0)]))
+                np.add.at(term_counts, (rows[i] + sentence_ids[inside], terms[inside]), 1)
+
+            tagged = self._score_sentences(term_counts, tier_matrices) >= self.FOLKLORE_THRESHOLD
+
+            state_sentences = []
+            for row in np.flatnonzero(tagged.any(axis=1)):
+                i = int(np.searchsorted(rows, row, side='right') - 1)
+                start, end = indexed[i]['sentences'][row - rows[i]]
+                state_sentences.append({
+                    'narrative': i,
+                    'name': indexed[i]['name'],
+                    'start': start,
+                    'end': end,
+                    'text': data['narratives'][i]['text'][start:end],
+                    'categories': [categories[c] for c in np.flatnonzero(tagged[row])]
+                })
+
+            folklore_sentences[state] = state_sentences
+
+        self._folklore_sentences = folklore_sentences
+        return folklore_sentences
+
+    def extract_folklore(self, max_examples: int = 5) -> Dict:
+        """
+        Summarize folklore sentences for each state.
+
+        Args:
+            max_examples: Number of example sentences to keep per category
+
+        Returns:
+            Dictionary with folklore analysis for each state
+        """
+        folklore_analysis = {}
+
+        for state, sentences in self.classify_folklore_sentences().items():
+            folklore_counts = {category: 0 for category in self.FOLKLORE_FEATURES}
+            folklore_examples = defaultdict(list)
 
-                            # Extract a snippet around the match for context
-                            start = max(0, match.start() - 100)
-                            end = min(len(narrative['text']), match.end() + 100)
-                            snippet = narrative['text'][start:end].strip()
+            for sentence in sentences:
+                for category in sentence['categories']:
+                    folklore_counts[category] += 1
 
-                            # Only keep first 5 examples per category
-                            if len(folklore_examples[category]) < 5:
-                                folklore_examples[category].append({
-                                    'name': narrative['name'],
-                                    'snippet': snippet
-                                })
+                    if len(folklore_examples[category]) < max_examples:
+                        folklore_examples[category].append({
+                            'name': sentence['name'],
+                            'snippet': sentence['text']
+                        })
 
             folklore_analysis[state] = {
-                'folklore_counts': dict(folklore_counts),
-                'examples': {k: v for k, v in folklore_examples.items() if v}
+                'folklore_counts': folklore_counts,
+                'examples': dict(folklore_examples)
             }
 
         return folklore_analysis
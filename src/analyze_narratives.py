@@ -8,6 +8,8 @@ import os
 from parser import get_all_narratives
 from analysis import NarrativeAnalyzer
 
+SENTENCE_INDEX_PATH = 'data/sentence_index.json'
+
 
 def main():
     """Main execution function."""
@@ -36,6 +38,14 @@ def main():
 
     # Step 4: Extract folklore
     print("Step 4: Extracting folklore and folk tales...")
+    sentence_index_reused = False
+    if os.path.exists(SENTENCE_INDEX_PATH):
+        with open(SENTENCE_INDEX_PATH, 'r', encoding='utf-8') as f:
+            sentence_index_reused = analyzer.load_sentence_index(json.load(f))
+    sentence_index = analyzer.build_sentence_index()
+    print("  ✓ Reused stored sentence index" if sentence_index_reused
+          else "  ✓ Built sentence index")
+    folklore_sentences = analyzer.classify_folklore_sentences()
     folklore_analysis = analyzer.extract_folklore()
     print("✓ Folklore extraction complete")
     print()
@@ -94,6 +104,16 @@ def main():
         json.dump(folklore_analysis, f, indent=2)
     print("  ✓ folklore.json")
 
+    # Save sentence index (only when it was rebuilt) and tagged folklore sentences
+    if not sentence_index_reused:
+        with open(SENTENCE_INDEX_PATH, 'w', encoding='utf-8') as f:
+            json.dump(sentence_index, f)
+        print("  ✓ sentence_index.json")
+
+    with open('data/folklore_sentences.json', 'w', encoding='utf-8') as f:
+        json.dump(folklore_sentences, f, indent=2)
+    print("  ✓ folklore_sentences.json")
+
     # Save word frequencies
     with open('data/word_frequencies.json', 'w', encoding='utf-8') as f:
         json.dump(word_frequencies, f, indent=2)
@@ -0,0 +1,132 @@
+"""
+Tests for the sentence-level folklore classifier.
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+from analysis import NarrativeAnalyzer
+
+
+def classify(text: str) -> list:
+    """Classify a single-narrative text and return its tagged sentences."""
+    analyzer = NarrativeAnalyzer({
+        'Test': {'narratives': [{'name': 'TEST', 'text': text}]}
+    })
+    return analyzer.classify_folklore_sentences()['Test']
+
+
+@pytest.mark.parametrize('sentence', [
+    "The old folks used to tell us about the bear.",
+    "Old folks told us that once.",
+])
+def test_cue_phrases_keep_their_weak_terms(sentence):
+    tagged = classify(sentence)
+    assert len(tagged) == 1
+    assert 'Stories & Tales' in tagged[0]['categories']
+
+
+@pytest.mark.parametrize('sentence, category', [
+    ("We'd sit round de fire in de wintertime and tell ghos' stories till us "
+     "chillen 'fraid to go to bed at night.", 'Stories & Tales'),
+    ("I member all them Buh Rabbit story!", 'Stories & Tales'),
+    ("Dat's de only ghos' I eber see.", 'Ghost Stories'),
+])
+def test_dialect_spellings(sentence, category):
+    tagged = classify(sentence)
+    assert len(tagged) == 1
+    assert category in tagged[0]['categories']
+
+
+def test_sentence_index_reused_only_when_current():
+    narratives = {'Test': {'narratives': [{'name': 'TEST', 'text': 'One. Two.'}]}}
+    stored = NarrativeAnalyzer(narratives).build_sentence_index()
+
+    analyzer = NarrativeAnalyzer(narratives)
+    assert analyzer.load_sentence_index(stored)
+    assert analyzer.build_sentence_index() is stored
+
+    changed = {'Test': {'narratives': [{'name': 'TEST', 'text': 'One. Two. Three.'}]}}
+    assert not NarrativeAnalyzer(changed).load_sentence_index(stored)
+
+    # Same length, different text: the stored offsets no longer apply
+    reordered = {'Test': {'narratives': [{'name': 'TEST', 'text': 'Two. One.'}]}}
+    assert not NarrativeAnalyzer(reordered).load_sentence_index(stored)
+
+
+@pytest.mark.parametrize('sentence', [
+    "We had tea.",
+    "He told me to go.",
+    "The dead mule lay there.",
+    "I took sick and they called a doctor.",
+])
+def test_generic_word_alone_does_not_tag(sentence):
+    assert classify(sentence) == []
+
+
+@pytest.mark.parametrize('sentence', [
+    "Quills was a row of whistles made outen reeds, or sometimes they made 'em outen bark.",
+    "I didn't know it would make me sick, but was I sick?",
+    "She used bark and leaves to make the tan and brown colors.",
+    "Mrs. Avery related the story told to her of Mr. Heard's cruelty by her grandmother.",
+])
+def test_generic_context_does_not_tag(sentence):
+    assert classify(sentence) == []
+
+
+@pytest.mark.parametrize('sentence', [
+    "Led us together and told us what to say.",
+    "The white preachers told us to obey and told us not to steal eggs.",
+])
+def test_told_us_does_not_corroborate_itself(sentence):
+    assert classify(sentence) == []
+
+
+@pytest.mark.parametrize('category', list(NarrativeAnalyzer.FOLKLORE_FEATURES))
+def test_cues_do_not_contain_weak_terms(category):
+    features = NarrativeAnalyzer.FOLKLORE_FEATURES[category]
+    for cue in features['cues']:
+        for weak in features['weak']:
+            assert not re.search(r'\b' + re.escape(weak) + r'\b', cue), (cue, weak)
+
+
+def test_split_sentences_offsets():
+    text = 'Mrs. Austin came home. "Did you see it?" she asked\n\nHEADING\nNext line.'
+    spans = NarrativeAnalyzer.split_sentences(text)
+    assert [text[start:end] for start, end in spans] == [
+        'Mrs. Austin came home.',
+        '"Did you see it?"',
+        'she asked',
+        'HEADING\nNext line.',
+    ]
+
+
+def test_split_sentences_abbreviation_before_blank_line():
+    text = 'I saw Mr.\n\nJones was there.'
+    spans = NarrativeAnalyzer.split_sentences(text)
+    assert [text[start:end] for start, end in spans] == ['I saw Mr.', 'Jones was there.']
+
+
+def test_extract_folklore_counts_and_examples():
+    text = 'I saw a haint. We had tea. Another haint came. De ghos walked.'
+    analyzer = NarrativeAnalyzer({
+        'Test': {'narratives': [{'name': 'TEST', 'text': text}]}
+    })
+    folklore = analyzer.extract_folklore(max_examples=2)['Test']
+
+    assert set(folklore['folklore_counts']) == set(NarrativeAnalyzer.FOLKLORE_FEATURES)
+    assert folklore['folklore_counts']['Ghost Stories'] == 3
+    assert folklore['folklore_counts']['Folk Medicine'] == 0
+    assert list(folklore['examples']) == ['Ghost Stories']
+    assert folklore['examples']['Ghost Stories'] == [
+        {'name': 'TEST', 'snippet': 'I saw a haint.'},
+        {'name': 'TEST', 'snippet': 'Another haint came.'},
+    ]
+
+    tagged = analyzer.classify_folklore_sentences()['Test']
+    assert [text[s['start']:s['end']] for s in tagged] == [s['text'] for s in tagged]
@@ -0,0 +1,85 @@
+"""
+Tests for the folklore sentence API.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('flask')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'webapp'))
+
+import app as webapp
+
+
+FOLKLORE = {
+    'Texas': {
+        'folklore_counts': {'Ghost Stories': 2, 'Folk Medicine': 0},
+        'examples': {}
+    }
+}
+
+FOLKLORE_SENTENCES = {
+    'Florida': [],
+    'Texas': [
+        {'narrative': 0, 'name': 'A', 'start': 0, 'end': 14,
+         'text': 'I saw a haint.', 'categories': ['Ghost Stories']},
+        {'narrative': 0, 'name': 'A', 'start': 15, 'end': 33,
+         'text': 'Dat ghos come back.', 'categories': ['Ghost Stories']},
+    ]
+}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    for filename, data in [('folklore.json', FOLKLORE),
+                           ('folklore_sentences.json', FOLKLORE_SENTENCES)]:
+        with open(tmp_path / filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    monkeypatch.setattr(webapp, 'DATA_DIR', str(tmp_path))
+    return webapp.app.test_client()
+
+
+def test_folklore_sentences(client):
+    response = client.get('/api/folklore/Texas/Ghost Stories')
+    assert response.status_code == 200
+    assert response.json['count'] == 2
+    assert len(response.json['sentences']) == 2
+
+
+def test_folklore_sentences_limit(client):
+    response = client.get('/api/folklore/Texas/Ghost Stories?limit=1')
+    assert response.status_code == 200
+    assert response.json['count'] == 2
+    assert [s['text'] for s in response.json['sentences']] == ['I saw a haint.']
+
+
+def test_folklore_sentences_known_category_without_matches(client):
+    response = client.get('/api/folklore/Texas/Folk Medicine')
+    assert response.status_code == 200
+    assert response.json == {'count': 0, 'sentences': []}
+
+
+def test_folklore_sentences_unknown_state(client):
+    assert client.get('/api/folklore/Nowhere/Ghost Stories').status_code == 404
+
+
+def test_folklore_sentences_unknown_category(client):
+    assert client.get('/api/folklore/Texas/Nope').status_code == 404
+
+
+def test_folklore_sentences_state_missing_from_summary(client):
+    assert client.get('/api/folklore/Florida/Ghost Stories').status_code == 404
+
+
+def test_folklore_sentences_negative_limit(client):
+    assert client.get('/api/folklore/Texas/Ghost Stories?limit=-1').status_code == 400
+
+
+@pytest.mark.parametrize('limit', ['abc', '1.5', ''])
+def test_folklore_sentences_non_integer_limit(client, limit):
+    response = client.get(f'/api/folklore/Texas/Ghost Stories?limit={limit}')
+    assert response.status_code == 400
@@ -74,5 +74,32 @@ def get_folklore():
     return jsonify(folklore) if folklore else jsonify({'error': 'Data not found'}), 404
 
 
+@app.route('/api/folklore/<state>/<category>')
+def get_folklore_sentences(state, category):
+    """API endpoint to get tagged folklore sentences for a state and category."""
+    sentences = load_json('folklore_sentences.json')
+    folklore = load_json('folklore.json')
+    if not sentences or not folklore or state not in sentences:
+        return jsonify({'error': 'State not found'}), 404
+
+    if category not in folklore.get(state, {}).get('folklore_counts', {}):
+        return jsonify({'error': 'Category not found'}), 404
+
+    limit = request.args.get('limit')
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except ValueError:
+            return jsonify({'error': 'limit must be an integer'}), 400
+        if limit < 0:
+            return jsonify({'error': 'limit must not be negative'}), 400
+
+    matches = [s for s in sentences[state] if category in s['categories']]
+    return jsonify({
+        'count': len(matches),
+        'sentences': matches[:limit] if limit is not None else matches
+    })
+
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)